@@ -4,18 +4,27 @@ F1 Weekend Countdown Dashboard
 Displays countdowns to upcoming F1 sessions across multiple race weekends
 """
 
-from flask import Flask, render_template, jsonify, request, redirect, url_for, flash, session
+from flask import Flask, render_template, request, redirect, url_for, flash, get_flashed_messages, session
+import copy
+import gzip
 import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from werkzeug.utils import secure_filename
 import tempfile
+import time
+import uuid
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import logging
 import pytz
-from functools import wraps
+from functools import wraps, lru_cache
+from itertools import chain, repeat
+from operator import itemgetter
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 from flask_dance.contrib.github import make_github_blueprint, github
 
 # For PDF processing
@@ -24,6 +33,54 @@ try:
 except ImportError:
     pdfplumber = None
 
+# Optional PyMuPDF backend for PDF processing, enabled with PDF_BACKEND=pymupdf
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+PDF_BACKEND = os.environ.get('PDF_BACKEND', 'pdfplumber').lower()
+
+# Fast JSON (de)serialization - orjson if installed, then ujson, then stdlib json.
+# The implementation is picked once at import time.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ujson = None
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+if orjson:
+    json_loads = orjson.loads
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, optionally indented with 2 spaces"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+elif ujson:
+    json_loads = ujson.loads
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, optionally indented with 2 spaces"""
+        return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=False,
+                           escape_forward_slashes=False).encode('utf-8')
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, optionally indented with 2 spaces"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+# In-process git access for the /git page - pygit2 if installed, git CLI otherwise
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 # Configure logging first
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +93,10 @@ app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', os.urandom(32).hex())
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+def _json(obj, status=200):
+    """JSON response serialized with json_dumps rather than Flask's jsonify"""
+    return app.response_class(json_dumps(obj), status=status, mimetype='application/json')
+
 # GitHub OAuth configuration
 GITHUB_CLIENT_ID = os.environ.get('GITHUB_CLIENT_ID', '')
 GITHUB_CLIENT_SECRET = os.environ.get('GITHUB_CLIENT_SECRET', '')
@@ -81,6 +142,37 @@ def require_github_auth(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Last rendered body and its gzip encoding per HTML page, so an unchanged
+# page is not recompressed on every request
+_GZIP_PAGE_CACHE: Dict[str, tuple] = {}
+
+def gzip_html(f):
+    """Decorator to gzip an HTML page view, reusing the compressed body while it is unchanged"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        html = f(*args, **kwargs)
+        if not isinstance(html, str):
+            return html
+
+        # Quality lookup, so "gzip;q=0" counts as refusing gzip
+        if request.accept_encodings['gzip'] > 0:
+            cached = _GZIP_PAGE_CACHE.get(f.__name__)
+            if cached and cached[0] == html:
+                body = cached[1]
+            else:
+                body = gzip.compress(html.encode('utf-8'), compresslevel=6)
+                _GZIP_PAGE_CACHE[f.__name__] = (html, body)
+
+            response = app.response_class(body, mimetype='text/html')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = app.response_class(html, mimetype='text/html')
+
+        # Both variants depend on the request's Accept-Encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+    return decorated_function
+
 # Security headers
 @app.after_request
 def set_security_headers(response):
@@ -98,6 +190,183 @@ def allowed_file(filename):
 
 DATA_DIR = Path(__file__).parent / 'data'
 
+# Precompiled patterns for the timetable extractor (hot path on every page/row)
+_EVENT_RE = re.compile(r'FORMULA\s*1\s+([A-Z\s]+?)\s*GRAND\s*PRIX', re.IGNORECASE)
+_LOCATION_RE = re.compile(r'(Marina\s*Bay|Circuit[^,\n]*)', re.IGNORECASE)
+_VERSION_RE = re.compile(r'Version\s*(\d+)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'20\d{2}')
+# Day header, e.g. "SUNDAY 7 SEPTEMBER 2025" - whitespace is [^\S\n] so a match never spans lines
+_DAY_RE = re.compile(
+    r'(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)[^\S\n]*(\d{1,2})[^\S\n]*(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)[^\S\n]*(20\d{2})'
+)
+_MONTHS = {
+    'JANUARY': '01', 'FEBRUARY': '02', 'MARCH': '03',
+    'APRIL': '04', 'MAY': '05', 'JUNE': '06',
+    'JULY': '07', 'AUGUST': '08', 'SEPTEMBER': '09',
+    'OCTOBER': '10', 'NOVEMBER': '11', 'DECEMBER': '12'
+}
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2})')
+_CAMELCASE_RE = re.compile(r'([a-z])([A-Z])')
+_SEP_RE = re.compile(r'\s*([,/\-&])\s*')
+_SEP_CHARS = frozenset(',/-&')
+_PAREN_RE = re.compile(r'([A-Z])(\()')
+_APOS_RE = re.compile(r"'([A-Z])")
+_WS_RE = re.compile(r'\s+')
+
+# Compound words glued together by PDF text extraction, and their spaced forms
+_NORM_MAP = {
+    # Core F1 terms
+    'F1ACADEMY': 'F1 ACADEMY',
+    'F1EXPERIENCES': 'F1 EXPERIENCES',
+    'FORMULA1': 'FORMULA 1',
+    'F1STEWARDS': 'F1 STEWARDS',
+    'F1CAR': 'F1 CAR',
+    'F1DRIVERS': 'F1 DRIVERS',
+    'F1PASS': 'F1 PASS',
+    'F1SYSTEMS': 'F1 SYSTEMS',
+    'TOOF1': 'TO F1',
+    'OPENTOF1': 'OPEN TO F1',
+
+    # Location compounds
+    'PITLANE': 'PIT LANE',
+    'PITLANEWALK': 'PIT LANE WALK',
+    'LANEWALK': 'LANE WALK',
+    'PITLANEOPEN': 'PIT LANE OPEN',
+    'LANEOPEN': 'LANE OPEN',
+    'PRESSCONFERENCEROOM': 'PRESS CONFERENCE ROOM',
+    'PRESSCONFERENCE': 'PRESS CONFERENCE',
+    'ONLINEMEETING': 'ONLINE MEETING',
+
+    # Track related
+    'TRACKCLOSED': 'TRACK CLOSED',
+    'TRACKOPEN': 'TRACK OPEN',
+    'TRACKINSPECTION': 'TRACK INSPECTION',
+    'TRACKACCESS': 'TRACK ACCESS',
+    'TRACKTEST': 'TRACK TEST',
+    'TRACKCOMPLETELYCLEAR': 'TRACK COMPLETELY CLEAR',
+
+    # Safety/Medical
+    'SAFETYCAR': 'SAFETY CAR',
+    'SAFETYCARTEST': 'SAFETY CAR TEST',
+    'CARTEST': 'CAR TEST',
+    'MEDICALCAR': 'MEDICAL CAR',
+    'MEDICALCARS': 'MEDICAL CARS',
+    'MEDICALINSPECTION': 'MEDICAL INSPECTION',
+    'MEDICALINTERVENTION': 'MEDICAL INTERVENTION',
+    'INTERVENTIONEXERCISE': 'INTERVENTION EXERCISE',
+    'HIGHSPEEDTRACKTEST': 'HIGH SPEED TRACK TEST',
+    'HIGHSPEEDTRACK': 'HIGH SPEED TRACK',
+    'FIASAFETY': 'FIA SAFETY',
+
+    # Curfew
+    'TEAMCURFEW': 'TEAM CURFEW',
+    'CURFEWENDS': 'CURFEW ENDS',
+    'CURFEWSTARTS': 'CURFEW STARTS',
+
+    # Session types
+    'PRACTICESESSION': 'PRACTICE SESSION',
+    'QUALIFYINGSESSION': 'QUALIFYING SESSION',
+    'FIRSTPRACTICE': 'FIRST PRACTICE',
+    'SECONDPRACTICE': 'SECOND PRACTICE',
+    'THIRDPRACTICE': 'THIRD PRACTICE',
+    'GRANDPRIX': 'GRAND PRIX',
+    'GRIDPROCEDURE': 'GRID PROCEDURE',
+
+    # Race specifics
+    'FIRSTRACE': 'FIRST RACE',
+    'SECONDRACE': 'SECOND RACE',
+    'LAPSOR': 'LAPS OR',
+    'LAPS,MAX': 'LAPS, MAX',
+    'MAX30MINS': 'MAX 30 MINS',
+    '30MINS': '30 MINS',
+    '120MINUTES': '120 MINUTES',
+    '12LAPS': '12 LAPS',
+    '14LAPS': '14 LAPS',
+    '62LAPS': '62 LAPS',
+
+    # Facilities/Events
+    'PASSHOLDERS': 'PASS HOLDERS',
+    'PADDOCKCLUB': 'PADDOCK CLUB',
+    'CLUBPIT': 'CLUB PIT',
+    'COMMUNITYPIT': 'COMMUNITY PIT',
+    'TEAMMANAGERS': 'TEAM MANAGERS',
+    'TEAMSPRESS': 'TEAMS PRESS',
+    'PROMOTERACTIVITY': 'PROMOTER ACTIVITY',
+    'STEMRACING': 'STEM RACING',
+    'PORSCHECARRERACUP': 'PORSCHE CARRERA CUP',
+    'NATIONALANTHEM': 'NATIONAL ANTHEM',
+    'MARSHALLS': 'MARSHALLS',
+    'SECURITYBRIEFING': 'SECURITY BRIEFING',
+
+    # Presentation/Ceremony
+    'CARPRESENTATION': 'CAR PRESENTATION',
+    'CARCOVERSEALS': 'CAR COVER SEALS',
+    'COVERSEALS': 'COVER SEALS',
+    'SEALSREMOVED': 'SEALS REMOVED',
+    'EXPERIENCESCHAMPIONSCLUB': 'EXPERIENCES CHAMPIONS CLUB',
+    'CHAMPIONSCLUBTROPHY': 'CHAMPIONS CLUB TROPHY',
+    'CLUBTROPHY': 'CLUB TROPHY',
+    'TROPHYPHOTO': 'TROPHY PHOTO',
+    'GRIDWALK': 'GRID WALK',
+    'DRIVERS': 'DRIVERS',
+    'FAMILIARISATION': 'FAMILIARISATION',
+    'SYSTEMSCHECKS': 'SYSTEMS CHECKS',
+}
+
+# Matches if any _NORM_MAP key occurs, to skip the replace chain for clean text
+_NORM_RE = re.compile('|'.join(re.escape(k) for k in _NORM_MAP))
+
+
+def _keywords_re(*keywords):
+    """Compile keywords into one pattern that ignores spaces anywhere inside a keyword"""
+    return re.compile('|'.join(' *'.join(map(re.escape, keyword)) for keyword in keywords))
+
+# Cell keywords identifying the category and location columns
+_CATEGORY_RE = _keywords_re('FORMULA1', 'F1ACADEMY', 'PORSCHE', 'FIA', 'PROMOTER', 'PADDOCK',
+                            'F1EXPERIENCES', 'STEMRACING')
+_LOCATION_KW_RE = _keywords_re('TRACK', 'PITLANE', 'PRESSCONFERENCEROOM', 'ONLINEMEETING')
+
+
+class _PyMuPDFPage:
+    """pdfplumber-style page API on top of a PyMuPDF page"""
+
+    def __init__(self, page):
+        self._page = page
+
+    def extract_text(self) -> str:
+        return self._page.get_text('text')
+
+    def extract_tables(self) -> List[List[List[Optional[str]]]]:
+        return [table.extract() for table in self._page.find_tables().tables]
+
+    def close(self) -> None:
+        pass
+
+
+class _PyMuPDFDocument:
+    """pdfplumber-style document API on top of PyMuPDF, usable as a context manager"""
+
+    def __init__(self, pdf_path):
+        self._doc = pymupdf.open(pdf_path)
+        self.pages = [_PyMuPDFPage(page) for page in self._doc]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._doc.close()
+
+
+def _open_pdf(pdf_path):
+    """Open a PDF with the configured backend, falling back to pdfplumber"""
+    if PDF_BACKEND == 'pymupdf' and pymupdf:
+        return _PyMuPDFDocument(pdf_path)
+
+    if not pdfplumber:
+        raise ImportError("pdfplumber is required for PDF processing. Please install it with: pip install pdfplumber")
+
+    return pdfplumber.open(pdf_path)
+
 
 class F1TimetableRawExtractor:
     """
@@ -119,55 +388,100 @@ class F1TimetableRawExtractor:
         """
         Main extraction method - captures everything
         """
-        if not pdfplumber:
-            raise ImportError("pdfplumber is required for PDF processing. Please install it with: pip install pdfplumber")
+        self.data['days'] = list(self.iter_days())
+        logger.info(f"Extraction complete: {len(self.data['days'])} days extracted")
+        return self.data
 
+    def iter_days(self) -> Iterator[Dict[str, Any]]:
+        """
+        Extract lazily, yielding one day object at a time without keeping them.
+        Metadata from the first page is filled into self.data before the first day is yielded.
+        """
         try:
             logger.info(f"Processing PDF: {self.pdf_path}")
 
-            with pdfplumber.open(self.pdf_path) as pdf:
-                # Extract metadata from first page
-                self._extract_metadata(pdf.pages[0])
+            with _open_pdf(self.pdf_path) as pdf:
+                page_count = len(pdf.pages)
+                workers = _page_workers(page_count)
 
-                # Process each page
-                for page_num, page in enumerate(pdf.pages, 1):
-                    logger.info(f"Processing page {page_num}/{len(pdf.pages)}")
-                    self._extract_page_data(page, page_num)
+                if workers > 1:
+                    # Metadata here, the pages themselves in a process pool below
+                    self._extract_metadata(pdf.pages[0])
+                else:
+                    yield from self._iter_pages(pdf, range(1, page_count + 1))
 
-            logger.info(f"Extraction complete: {len(self.data['days'])} days extracted")
-            return self.data
+            if workers > 1:
+                yield from self._iter_pages_parallel(page_count, workers)
 
         except Exception as e:
             logger.error(f"Extraction failed: {e}", exc_info=True)
             raise
 
+    def _iter_pages(self, pdf, page_numbers, extract_metadata: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Extract the given pages of an open PDF one page at a time, yielding their day objects
+        """
+        page_count = len(pdf.pages)
+
+        for page_num in page_numbers:
+            page = pdf.pages[page_num - 1]
+            logger.info(f"Processing page {page_num}/{page_count}")
+            try:
+                # Extract metadata from first page
+                if page_num == 1 and extract_metadata:
+                    self._extract_metadata(page)
+
+                day_object = self._extract_page_data(page, page_num)
+            finally:
+                # Release the page's parsed char/line caches before moving on
+                if hasattr(page, 'close'):
+                    page.close()
+                else:
+                    page.flush_cache()
+
+            if day_object:
+                yield day_object
+
+    def _iter_pages_parallel(self, page_count: int, workers: int) -> Iterator[Dict[str, Any]]:
+        """
+        Extract pages across a process pool, one contiguous run of pages per worker
+        """
+        chunk_size = -(-page_count // workers)
+        chunks = [range(start, min(start + chunk_size, page_count + 1))
+                  for start in range(1, page_count + 1, chunk_size)]
+
+        logger.info(f"Extracting {page_count} pages across {workers} processes")
+        # spawn rather than fork - extraction runs on a background thread of the web worker
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            for days in pool.map(_extract_page_chunk, repeat(str(self.pdf_path)), chunks):
+                yield from days
+
     def _extract_metadata(self, first_page) -> None:
         """
         Extract event metadata from the first page
         """
         try:
-            text = first_page.extract_text()
-            all_text = '\n'.join(text.split('\n'))
+            all_text = first_page.extract_text()
 
             # Extract event name
-            match = re.search(r'FORMULA\s*1\s+([A-Z\s]+?)\s*GRAND\s*PRIX', all_text, re.IGNORECASE)
+            match = _EVENT_RE.search(all_text)
             if match:
                 event_middle = match.group(1).strip()
-                event_middle = re.sub(r'([a-z])([A-Z])', r'\1 \2', event_middle)
+                event_middle = _CAMELCASE_RE.sub(r'\1 \2', event_middle)
                 self.data['event_name'] = f"FORMULA 1 {event_middle} GRAND PRIX"
 
             # Extract location
-            match = re.search(r'(Marina\s*Bay|Circuit[^,\n]*)', all_text, re.IGNORECASE)
+            match = _LOCATION_RE.search(all_text)
             if match:
-                self.data['location'] = re.sub(r'\s+', ' ', match.group(0).strip())
+                self.data['location'] = _WS_RE.sub(' ', match.group(0).strip())
 
             # Extract version
-            match = re.search(r'Version\s*(\d+)', all_text, re.IGNORECASE)
+            match = _VERSION_RE.search(all_text)
             if match:
                 self.data['version'] = match.group(1)
 
             # Extract year
-            year_match = re.search(r'20\d{2}', all_text)
+            year_match = _YEAR_RE.search(all_text)
             if year_match:
                 self.data['year'] = year_match.group(0)
 
@@ -176,9 +490,10 @@ class F1TimetableRawExtractor:
         except Exception as e:
             logger.warning(f"Metadata extraction partial failure: {e}")
 
-    def _extract_page_data(self, page, page_num: int) -> None:
+    def _extract_page_data(self, page, page_num: int) -> Optional[Dict[str, Any]]:
         """
         Extract all data from a page - no filtering
+        Returns the page's day object, or None if the page has no timetable
         """
         try:
             # Extract tables
@@ -186,20 +501,25 @@ class F1TimetableRawExtractor:
 
             if not tables:
                 logger.warning(f"No tables found on page {page_num}")
-                return
+                return None
 
-            # Get main table
-            main_table = max(tables, key=lambda t: len(t) if t else 0)
+            # Get main table (the one with the most rows)
+            main_table = None
+            best = 0
+            for table in tables:
+                if table and len(table) > best:
+                    best = len(table)
+                    main_table = table
 
             if not main_table or len(main_table) < 2:
                 logger.warning(f"Invalid table structure on page {page_num}")
-                return
+                return None
 
             # Extract day info
             day_info = self._extract_day_info(page)
             if not day_info:
                 logger.warning(f"Could not extract day info from page {page_num}")
-                return
+                return None
 
             # Create day object
             day_object = {
@@ -217,11 +537,12 @@ class F1TimetableRawExtractor:
                 if event:
                     day_object['events'].append(event)
 
-            self.data['days'].append(day_object)
             logger.info(f"Extracted {len(day_object['events'])} events from {day_info['date']}")
+            return day_object
 
         except Exception as e:
             logger.error(f"Error extracting page {page_num}: {e}", exc_info=True)
+            return None
 
     def _extract_day_info(self, page) -> Optional[Dict[str, str]]:
         """
@@ -229,27 +550,31 @@ class F1TimetableRawExtractor:
         """
         try:
             text = page.extract_text()
-            lines = text.split('\n')
-
-            for line in lines[:15]:
-                match = re.search(
-                    r'(MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY)\s*(\d{1,2})\s*(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s*(20\d{2})',
-                    line
-                )
-                if match:
-                    day_name = match.group(1).title()
-                    day = match.group(2).zfill(2)
-                    month = match.group(3)
-                    year = match.group(4)
-
-                    date_str = f"{year}-{self._month_to_number(month)}-{day}"
-
-                    return {
-                        'day_name': day_name,
-                        'date': date_str
-                    }
 
-            return None
+            # Only the header block (first 15 lines) is searched - find where it
+            # ends rather than splitting the whole page into lines
+            header_end = -1
+            for _ in range(15):
+                header_end = text.find('\n', header_end + 1)
+                if header_end == -1:
+                    header_end = len(text)
+                    break
+
+            match = _DAY_RE.search(text, 0, header_end)
+            if not match:
+                return None
+
+            day_name = match.group(1).title()
+            day = match.group(2).zfill(2)
+            month = match.group(3)
+            year = match.group(4)
+
+            date_str = f"{year}-{self._month_to_number(month)}-{day}"
+
+            return {
+                'day_name': day_name,
+                'date': date_str
+            }
 
         except Exception as e:
             logger.error(f"Error extracting day info: {e}")
@@ -270,11 +595,10 @@ class F1TimetableRawExtractor:
             # Extract times
             start_time = ''
             end_time = ''
-            time_pattern = r'(\d{1,2}:\d{2})'
 
             # Check first 3 cells for times
             for i, cell in enumerate(row[:3]):
-                times = re.findall(time_pattern, cell)
+                times = _TIME_RE.findall(cell)
                 if times:
                     if not start_time:
                         start_time = times[0]
@@ -290,32 +614,28 @@ class F1TimetableRawExtractor:
                 'description': ''
             }
 
-            # Extract category, location, and description from remaining cells
-            for i, cell in enumerate(row):
-                cell_upper = cell.upper()
-
-                # Skip time columns
-                if i < 2:
+            # Extract category, location, and description from remaining cells,
+            # skipping the time columns and empty cells up front
+            for i, cell in enumerate(row[2:], 2):
+                if not cell:
                     continue
 
+                cell_upper = cell.upper()
+
                 # Try to identify category (index 2)
-                if i == 2 and cell:
-                    if any(keyword in cell_upper.replace(' ', '') for keyword in
-                          ['FORMULA1', 'F1ACADEMY', 'PORSCHE', 'FIA', 'PROMOTER', 'PADDOCK',
-                           'F1EXPERIENCES', 'STEMRACING']):
-                        event['category'] = self._normalize_text(cell)
-                        continue
+                if i == 2 and _CATEGORY_RE.search(cell_upper):
+                    event['category'] = self._normalize_text(cell)
+                    continue
 
                 # Try to identify location
-                if any(keyword in cell_upper.replace(' ', '') for keyword in
-                      ['TRACK', 'PITLANE', 'PRESSCONFERENCEROOM', 'ONLINEMEETING']):
+                if _LOCATION_KW_RE.search(cell_upper):
                     event['location'] = self._normalize_text(cell)
                     continue
 
                 # Everything else is description
-                if cell and not event['description']:
+                if not event['description']:
                     event['description'] = self._normalize_text(cell)
-                elif cell:
+                else:
                     # Append if we have multiple description cells
                     event['description'] = f"{event['description']} - {self._normalize_text(cell)}"
 
@@ -329,153 +649,83 @@ class F1TimetableRawExtractor:
             logger.warning(f"Error parsing row: {e}")
             return None
 
-    def _normalize_text(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_text(text: str) -> str:
         """
         Normalize text by adding spaces where needed
         Handles all compound words and spacing issues
+        Pure and memoized - timetables repeat the same cell text many times
         """
         if not text:
             return text
 
-        # Comprehensive replacements - do these FIRST before any regex
-        replacements = {
-            # Core F1 terms
-            'F1ACADEMY': 'F1 ACADEMY',
-            'F1EXPERIENCES': 'F1 EXPERIENCES',
-            'FORMULA1': 'FORMULA 1',
-            'F1STEWARDS': 'F1 STEWARDS',
-            'F1CAR': 'F1 CAR',
-            'F1DRIVERS': 'F1 DRIVERS',
-            'F1PASS': 'F1 PASS',
-            'F1SYSTEMS': 'F1 SYSTEMS',
-            'TOOF1': 'TO F1',
-            'OPENTOF1': 'OPEN TO F1',
-
-            # Location compounds
-            'PITLANE': 'PIT LANE',
-            'PITLANEWALK': 'PIT LANE WALK',
-            'LANEWALK': 'LANE WALK',
-            'PITLANEOPEN': 'PIT LANE OPEN',
-            'LANEOPEN': 'LANE OPEN',
-            'PRESSCONFERENCEROOM': 'PRESS CONFERENCE ROOM',
-            'PRESSCONFERENCE': 'PRESS CONFERENCE',
-            'ONLINEMEETING': 'ONLINE MEETING',
-
-            # Track related
-            'TRACKCLOSED': 'TRACK CLOSED',
-            'TRACKOPEN': 'TRACK OPEN',
-            'TRACKINSPECTION': 'TRACK INSPECTION',
-            'TRACKACCESS': 'TRACK ACCESS',
-            'TRACKTEST': 'TRACK TEST',
-            'TRACKCOMPLETELYCLEAR': 'TRACK COMPLETELY CLEAR',
-
-            # Safety/Medical
-            'SAFETYCAR': 'SAFETY CAR',
-            'SAFETYCARTEST': 'SAFETY CAR TEST',
-            'CARTEST': 'CAR TEST',
-            'MEDICALCAR': 'MEDICAL CAR',
-            'MEDICALCARS': 'MEDICAL CARS',
-            'MEDICALINSPECTION': 'MEDICAL INSPECTION',
-            'MEDICALINTERVENTION': 'MEDICAL INTERVENTION',
-            'INTERVENTIONEXERCISE': 'INTERVENTION EXERCISE',
-            'HIGHSPEEDTRACKTEST': 'HIGH SPEED TRACK TEST',
-            'HIGHSPEEDTRACK': 'HIGH SPEED TRACK',
-            'FIASAFETY': 'FIA SAFETY',
-
-            # Curfew
-            'TEAMCURFEW': 'TEAM CURFEW',
-            'CURFEWENDS': 'CURFEW ENDS',
-            'CURFEWSTARTS': 'CURFEW STARTS',
-
-            # Session types
-            'PRACTICESESSION': 'PRACTICE SESSION',
-            'QUALIFYINGSESSION': 'QUALIFYING SESSION',
-            'FIRSTPRACTICE': 'FIRST PRACTICE',
-            'SECONDPRACTICE': 'SECOND PRACTICE',
-            'THIRDPRACTICE': 'THIRD PRACTICE',
-            'GRANDPRIX': 'GRAND PRIX',
-            'GRIDPROCEDURE': 'GRID PROCEDURE',
-
-            # Race specifics
-            'FIRSTRACE': 'FIRST RACE',
-            'SECONDRACE': 'SECOND RACE',
-            'LAPSOR': 'LAPS OR',
-            'LAPS,MAX': 'LAPS, MAX',
-            'MAX30MINS': 'MAX 30 MINS',
-            '30MINS': '30 MINS',
-            '120MINUTES': '120 MINUTES',
-            '12LAPS': '12 LAPS',
-            '14LAPS': '14 LAPS',
-            '62LAPS': '62 LAPS',
-
-            # Facilities/Events
-            'PASSHOLDERS': 'PASS HOLDERS',
-            'PADDOCKCLUB': 'PADDOCK CLUB',
-            'CLUBPIT': 'CLUB PIT',
-            'COMMUNITYPIT': 'COMMUNITY PIT',
-            'TEAMMANAGERS': 'TEAM MANAGERS',
-            'TEAMSPRESS': 'TEAMS PRESS',
-            'PROMOTERACTIVITY': 'PROMOTER ACTIVITY',
-            'STEMRACING': 'STEM RACING',
-            'PORSCHECARRERACUP': 'PORSCHE CARRERA CUP',
-            'NATIONALANTHEM': 'NATIONAL ANTHEM',
-            'MARSHALLS': 'MARSHALLS',
-            'SECURITYBRIEFING': 'SECURITY BRIEFING',
-
-            # Presentation/Ceremony
-            'CARPRESENTATION': 'CAR PRESENTATION',
-            'CARCOVERSEALS': 'CAR COVER SEALS',
-            'COVERSEALS': 'COVER SEALS',
-            'SEALSREMOVED': 'SEALS REMOVED',
-            'EXPERIENCESCHAMPIONSCLUB': 'EXPERIENCES CHAMPIONS CLUB',
-            'CHAMPIONSCLUBTROPHY': 'CHAMPIONS CLUB TROPHY',
-            'CLUBTROPHY': 'CLUB TROPHY',
-            'TROPHYPHOTO': 'TROPHY PHOTO',
-            'GRIDWALK': 'GRID WALK',
-            'DRIVERS': 'DRIVERS',
-            'FAMILIARISATION': 'FAMILIARISATION',
-            'SYSTEMSCHECKS': 'SYSTEMS CHECKS',
-        }
-
-        # Apply all replacements
+        # Apply all compound-word replacements in order - later keys such as
+        # CARCOVERSEALS rely on the text earlier keys leave behind, so this must
+        # stay a sequential replace chain. One scan for any key skips the chain
+        # for the many cells that contain none.
         normalized = text.upper()
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
+        if _NORM_RE.search(normalized):
+            for old, new in _NORM_MAP.items():
+                normalized = normalized.replace(old, new)
 
-        # Fix specific patterns
+        # Fix specific patterns - each regex only runs when its trigger character
+        # is present, which skips the regex engine entirely for most cells
         # Remove extra spaces around special chars and fix them
-        normalized = re.sub(r'\s*([,/\-&])\s*', r' \1 ', normalized)
+        if not _SEP_CHARS.isdisjoint(normalized):
+            normalized = _SEP_RE.sub(r' \1 ', normalized)
 
         # Add space between letter and opening parenthesis
-        normalized = re.sub(r'([A-Z])(\()', r'\1 \2', normalized)
+        if '(' in normalized:
+            normalized = _PAREN_RE.sub(r'\1 \2', normalized)
 
         # Clean up "FORFIA/F1ONLY" type patterns
         normalized = normalized.replace('FORFIA', 'FOR FIA')
         normalized = normalized.replace('F1ONLY', 'F1 ONLY')
 
         # Fix apostrophes - ensure space after
-        normalized = re.sub(r"'([A-Z])", r"' \1", normalized)
+        if "'" in normalized:
+            normalized = _APOS_RE.sub(r"' \1", normalized)
 
-        # Clean up multiple spaces
-        normalized = re.sub(r'\s+', ' ', normalized)
+        # Clean up multiple spaces - any whitespace other than ' ' is non-printable
+        if '  ' in normalized or not normalized.isprintable():
+            normalized = _WS_RE.sub(' ', normalized)
 
         return normalized.strip()
 
     def _month_to_number(self, month_name: str) -> str:
         """Convert month name to number"""
-        months = {
-            'JANUARY': '01', 'FEBRUARY': '02', 'MARCH': '03',
-            'APRIL': '04', 'MAY': '05', 'JUNE': '06',
-            'JULY': '07', 'AUGUST': '08', 'SEPTEMBER': '09',
-            'OCTOBER': '10', 'NOVEMBER': '11', 'DECEMBER': '12'
-        }
-        return months.get(month_name, '00')
+        return _MONTHS.get(month_name, '00')
+
+    def write_json(self, output_path: str) -> int:
+        """
+        Extract straight to a JSON file, holding at most one day in memory.
+        Returns the number of days written.
+        """
+        days = self.iter_days()
+        # Pulling the first day also fills in the metadata from the first page
+        day = next(days, None)
+        metadata = {key: value for key, value in self.data.items() if key != 'days'}
+
+        count = 0
+        with open(output_path, 'wb') as f:
+            f.write(json_dumps(metadata)[:-1] + b',"days":[')
+            while day is not None:
+                if count:
+                    f.write(b',\n')
+                f.write(json_dumps(day))
+                count += 1
+                day = next(days, None)
+            f.write(b']}\n')
+
+        logger.info(f"Streamed {count} days to {output_path}")
+        return count
 
     def to_json(self, output_path: Optional[str] = None, indent: int = 2) -> str:
         """
-        Export to clean, well-formatted JSON
+        Export to clean, well-formatted JSON (indented with 2 spaces unless indent is 0)
         """
-        json_str = json.dumps(self.data, indent=indent, ensure_ascii=False)
+        json_str = json_dumps(self.data, indent=bool(indent)).decode('utf-8')
 
         if output_path:
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -484,6 +734,25 @@ class F1TimetableRawExtractor:
 
         return json_str
 
+# Short timetables are extracted serially - below this many pages, starting
+# worker processes costs more than the per-page table extraction it saves
+PDF_PARALLEL_MIN_PAGES = 20
+
+def _page_workers(page_count):
+    """Number of processes to extract a PDF with (1 means serial)"""
+    if page_count < PDF_PARALLEL_MIN_PAGES:
+        return 1
+    return min(os.cpu_count() or 1, page_count // 5 + 1)
+
+def _extract_page_chunk(pdf_path, page_numbers):
+    """Process pool worker - extract the days found on a run of pages"""
+    extractor = F1TimetableRawExtractor(pdf_path)
+    with _open_pdf(pdf_path) as pdf:
+        return list(extractor._iter_pages(pdf, page_numbers, extract_metadata=False))
+
+# Parsed race data per file, as (mtime_ns, data) - files are only re-read when they change
+_FILE_CACHE: Dict[Path, tuple] = {}
+
 def load_race_data():
     """Load all race weekend data from JSON files"""
     races = []
@@ -496,20 +765,68 @@ def load_race_data():
                 continue
 
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                mtime = filepath.stat().st_mtime_ns
+                cached = _FILE_CACHE.get(filepath)
+                if cached and cached[0] == mtime:
+                    races.append(cached[1])
+                    continue
 
-                    # Generate race name from filename or use event_name from data
-                    race_name = data.get('event_name') or data.get('location') or filepath.stem.title()
-                    data['race_name'] = race_name
-                    races.append(data)
-                    logger.info(f"Loaded race data from {filepath.name}: {race_name}")
+                data = json_loads(filepath.read_bytes())
+
+                # Generate race name from filename or use event_name from data
+                race_name = data.get('event_name') or data.get('location') or filepath.stem.title()
+                data['race_name'] = race_name
+                _FILE_CACHE[filepath] = (mtime, data)
+                races.append(data)
+                logger.info(f"Loaded race data from {filepath.name}: {race_name}")
 
             except Exception as e:
                 logger.error(f"Error loading {filepath.name}: {e}")
 
     return races
 
+@lru_cache(maxsize=64)
+def _tz(name):
+    """Return a cached pytz timezone - only a handful of zones are ever used"""
+    return pytz.timezone(name)
+
+def _build_session(entry, date_key, day_name, race_name, location, tz, timezone_name):
+    """Build a timestamped session dict for one schedule entry, or None if it has no usable start time"""
+    start_time = entry.get('start_time', '')
+
+    # Skip if no start time
+    if not start_time:
+        return None
+
+    # Parse as naive datetime first - date_key is YYYY-MM-DD and start_time is HH:MM,
+    # so split them by hand rather than going through the much slower strptime
+    try:
+        year, month, day = date_key.split('-')
+        hour, minute = start_time.split(':')
+        naive_dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
+    except (ValueError, AttributeError):
+        return None
+
+    # Localize to event timezone
+    local_dt = tz.localize(naive_dt)
+
+    # Convert to UTC for storage
+    utc_dt = local_dt.astimezone(pytz.UTC)
+
+    return {
+        'race': race_name,
+        'location': location,
+        'day': day_name,
+        'date': date_key,
+        'time': start_time,
+        'category': entry.get('category', ''),
+        'activity': entry.get('activity', ''),
+        'datetime': utc_dt.isoformat(),
+        'local_datetime': local_dt.isoformat(),
+        'timezone': timezone_name,
+        'timestamp': utc_dt.timestamp()
+    }
+
 def get_all_sessions(races):
     """Extract ALL sessions (F1, F2, F3, etc.) with timestamps"""
     all_sessions = []
@@ -524,104 +841,31 @@ def get_all_sessions(races):
     for race in races:
         race_name = race.get('race_name', 'Unknown')
         location = race.get('location', '')
-        year = race.get('year', '')
 
         # Get timezone for this location, default to UTC
         timezone_name = location_timezones.get(location, 'UTC')
+        tz = _tz(timezone_name)
 
         for date_key, day_data in race.get('days', {}).items():
             day_name = day_data.get('day_name', '')
 
-            # Get ALL sessions (no filtering)
-            for session in day_data.get('sessions', []):
-                start_time = session.get('start_time', '')
-                category = session.get('category', '')
-
-                # Parse datetime
-                try:
-                    # Parse as naive datetime first
-                    naive_dt = datetime.strptime(
-                        f"{date_key} {start_time}",
-                        "%Y-%m-%d %H:%M"
-                    )
-
-                    # Localize to event timezone
-                    tz = pytz.timezone(timezone_name)
-                    local_dt = tz.localize(naive_dt)
-
-                    # Convert to UTC for storage
-                    utc_dt = local_dt.astimezone(pytz.UTC)
-
-                    all_sessions.append({
-                        'race': race_name,
-                        'location': location,
-                        'day': day_name,
-                        'date': date_key,
-                        'time': start_time,
-                        'category': category,
-                        'activity': session.get('activity', ''),
-                        'datetime': utc_dt.isoformat(),
-                        'local_datetime': local_dt.isoformat(),
-                        'timezone': timezone_name,
-                        'timestamp': utc_dt.timestamp()
-                    })
-                except ValueError:
-                    continue
-
-            # Also include other_events if needed
-            for event in day_data.get('other_events', []):
-                start_time = event.get('start_time', '')
-                category = event.get('category', '')
-
-                # Skip if no start time
-                if not start_time:
-                    continue
+            # Get ALL sessions (no filtering), plus other_events
+            for entry in chain(day_data.get('sessions', []), day_data.get('other_events', [])):
+                session_entry = _build_session(entry, date_key, day_name, race_name, location, tz, timezone_name)
+                if session_entry:
+                    all_sessions.append(session_entry)
 
-                # Parse datetime
-                try:
-                    # Parse as naive datetime first
-                    naive_dt = datetime.strptime(
-                        f"{date_key} {start_time}",
-                        "%Y-%m-%d %H:%M"
-                    )
-
-                    # Localize to event timezone
-                    tz = pytz.timezone(timezone_name)
-                    local_dt = tz.localize(naive_dt)
-
-                    # Convert to UTC for storage
-                    utc_dt = local_dt.astimezone(pytz.UTC)
-
-                    all_sessions.append({
-                        'race': race_name,
-                        'location': location,
-                        'day': day_name,
-                        'date': date_key,
-                        'time': start_time,
-                        'category': category,
-                        'activity': event.get('activity', ''),
-                        'datetime': utc_dt.isoformat(),
-                        'local_datetime': local_dt.isoformat(),
-                        'timezone': timezone_name,
-                        'timestamp': utc_dt.timestamp()
-                    })
-                except ValueError:
-                    continue
+    # Sort by datetime
+    all_sessions.sort(key=itemgetter('timestamp'))
 
     # Filter out sessions that have already started
     now = datetime.now(pytz.UTC)
     current_timestamp = now.timestamp()
 
-    # Only show sessions that haven't started yet (future sessions only)
-    future_sessions = []
-    for session in all_sessions:
-        session_start = session['timestamp']
-        # Only keep sessions that start in the future
-        if session_start > current_timestamp:
-            future_sessions.append(session)
-
-    # Sort by datetime
-    future_sessions.sort(key=lambda x: x['timestamp'])
+    # Only show sessions that haven't started yet (future sessions only) -
+    # the list is sorted, so binary search for the first one after now
+    start = bisect_right(all_sessions, current_timestamp, key=itemgetter('timestamp'))
+    future_sessions = all_sessions[start:]
 
     return future_sessions
 
@@ -630,94 +874,91 @@ def index():
     """Main dashboard page"""
     return render_template('index.html')
 
+# Cached /api/sessions result - invalidated when the data directory changes, and
+# expired after a short TTL so sessions that have since started drop out
+_SESSIONS_CACHE = {'key': None, 'value': None, 'expires': 0}
+SESSIONS_CACHE_TTL = 30  # seconds
+
+def _data_dir_key():
+    """Cheap fingerprint of the data files: newest mtime and file count"""
+    mtimes = [p.stat().st_mtime_ns for p in DATA_DIR.glob('*.json')]
+    return (max(mtimes, default=0), len(mtimes))
+
 @app.route('/api/sessions')
 def api_sessions():
     """API endpoint to get all sessions - no filtering"""
-    races = load_race_data()
-    sessions = get_all_sessions(races)
+    key = _data_dir_key()
+    if _SESSIONS_CACHE['key'] == key and time.time() < _SESSIONS_CACHE['expires']:
+        sessions = _SESSIONS_CACHE['value']
+    else:
+        races = load_race_data()
+        sessions = get_all_sessions(races)
+        _SESSIONS_CACHE.update(key=key, value=sessions, expires=time.time() + SESSIONS_CACHE_TTL)
 
-    return jsonify({
+    return _json({
         'sessions': sessions,
         'current_time': datetime.now(pytz.UTC).isoformat()
     })
 
+# Background PDF extraction - job status is kept in small JSON files rather than
+# in memory so that any gunicorn worker can answer the status poll
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+UPLOAD_JOBS_DIR = Path(tempfile.gettempdir()) / 'f1_upload_jobs'
+_JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+UPLOAD_JOB_TTL = 3600  # seconds a finished job's status stays pollable
+
+def _set_upload_job(job_id, **status):
+    """Record the status of a background upload job"""
+    UPLOAD_JOBS_DIR.mkdir(exist_ok=True)
+    # Write to a temp file and rename it into place so a concurrent status
+    # poll never reads a truncated file
+    fd, temp_path = tempfile.mkstemp(dir=UPLOAD_JOBS_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_dumps(status))
+        os.replace(temp_path, UPLOAD_JOBS_DIR / f'{job_id}.json')
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+def _sweep_upload_jobs():
+    """Delete job status files older than UPLOAD_JOB_TTL"""
+    cutoff = time.time() - UPLOAD_JOB_TTL
+    try:
+        with os.scandir(UPLOAD_JOBS_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+def _get_upload_job(job_id):
+    """Return the recorded status of an upload job, or None if unknown"""
+    if not _JOB_ID_RE.fullmatch(job_id):
+        return None
+
+    try:
+        return json_loads((UPLOAD_JOBS_DIR / f'{job_id}.json').read_bytes())
+    except (OSError, ValueError):
+        return None
+
 @app.route('/upload')
 @require_github_auth
 def upload_page():
     """File upload page"""
-    flash_messages = []
-    for category, message in request.args.items():
-        if category in ['success', 'error']:
-            flash_messages.append(f'<div class="flash {category}">{message}</div>')
-
-    # Get actual flash messages from session
-    session_flashes = []
-    for category, message in flash.get_flashed_messages(with_categories=True):
-        session_flashes.append(f'<div class="flash {category}">{message}</div>')
-
-    all_flashes = ''.join(session_flashes + flash_messages)
-
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>F1 Data Upload</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; background: #0f1419; color: #e6e6e6; }}
-            .container {{ max-width: 600px; margin: 0 auto; }}
-            .upload-box {{ border: 2px dashed #e10600; padding: 40px; text-align: center; background: #1a1f2e; border-radius: 8px; }}
-            input[type="file"] {{ margin: 20px 0; }}
-            button {{ background: #e10600; color: white; padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; }}
-            button:hover {{ background: #ff0800; }}
-            .back-link {{ color: #e10600; text-decoration: none; }}
-            .back-link:hover {{ text-decoration: underline; }}
-            .flash {{ padding: 10px; margin: 10px 0; border-radius: 4px; }}
-            .flash.success {{ background: #28a745; }}
-            .flash.error {{ background: #dc3545; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🏁 Upload F1 Schedule Data</h1>
-            <p><a href="/" class="back-link">← Back to Dashboard</a></p>
-
-            {all_flashes}
-
-            <div class="upload-box">
-                <h3>Upload F1 Timetable PDF</h3>
-                <p>Upload an official F1 timetable PDF to automatically extract schedule data</p>
-                <form action="/upload" method="post" enctype="multipart/form-data">
-                    <input type="file" name="file" accept=".pdf" required>
-                    <br>
-                    <button type="submit">Upload & Parse</button>
-                </form>
-            </div>
-
-            <div style="margin-top: 30px;">
-                <h3>Current Data Files:</h3>
-                <div id="data-files">Loading...</div>
-            </div>
-        </div>
-
-        <script>
-            // Load current data files
-            fetch('/api/data-files')
-                .then(response => response.json())
-                .then(data => {{
-                    const container = document.getElementById('data-files');
-                    if (data.files.length === 0) {{
-                        container.innerHTML = '<em>No data files found</em>';
-                    }} else {{
-                        container.innerHTML = data.files.map(file =>
-                            `<div>📄 ${{file}}</div>`
-                        ).join('');
-                    }}
-                }});
-        </script>
-    </body>
-    </html>
-    '''
-    return html
+    # Flash messages from the session, plus any passed as query args
+    flashes = get_flashed_messages(with_categories=True) + [
+        (category, message) for category, message in request.args.items()
+        if category in ['success', 'error']
+    ]
+
+    return render_template('upload.html', flashes=flashes)
 
 @app.route('/upload', methods=['POST'])
 @require_github_auth
@@ -735,34 +976,62 @@ def upload_file():
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
 
+        # Reject anything that isn't a PDF before writing it to disk
+        magic = file.stream.read(5)
+        file.stream.seek(0)
+        if magic != b'%PDF-':
+            flash('File is not a valid PDF (magic byte check failed)', 'error')
+            return redirect(request.url)
+
         # Save to temporary file
         with tempfile.NamedTemporaryFile(mode='w+b', delete=False, suffix=f'_{filename}') as temp_file:
             file.save(temp_file.name)
             temp_path = temp_file.name
 
-        try:
-            # Here's where your parsing script will be called
-            result = parse_uploaded_file(temp_path, filename)
-
-            if result['success']:
-                flash(f'Successfully parsed and saved: {result["message"]}', 'success')
-            else:
-                flash(f'Parsing failed: {result["error"]}', 'error')
-
-        except Exception as e:
-            flash(f'Error processing file: {str(e)}', 'error')
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
+        # Extract in the background so large PDFs don't hold the request open
+        job_id = uuid.uuid4().hex
+        _sweep_upload_jobs()
+        _set_upload_job(job_id, status='processing', filename=filename)
+        UPLOAD_EXECUTOR.submit(_run_upload_job, job_id, temp_path, filename)
 
-        return redirect(url_for('upload_page'))
+        flash(f'Processing started for {filename}...', 'success')
+        return redirect(url_for('upload_page', job=job_id))
     else:
         flash('Invalid file type. Please upload JSON, CSV, TXT, or HTML files.', 'error')
         return redirect(request.url)
 
+def _run_upload_job(job_id, temp_path, filename):
+    """Background worker - parse an uploaded file and record the outcome for polling"""
+    try:
+        # Here's where your parsing script will be called
+        result = parse_uploaded_file(temp_path, filename)
+
+        if result['success']:
+            _SESSIONS_CACHE['key'] = None
+            _set_upload_job(job_id, status='success', message=f'Successfully parsed and saved: {result["message"]}')
+        else:
+            _set_upload_job(job_id, status='error', message=f'Parsing failed: {result["error"]}')
+
+    except Exception as e:
+        logger.error(f"Upload job {job_id} failed: {e}", exc_info=True)
+        _set_upload_job(job_id, status='error', message=f'Error processing file: {str(e)}')
+    finally:
+        # Clean up temp file
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+@app.route('/api/upload-status/<job_id>')
+@require_github_auth
+def api_upload_status(job_id):
+    """API endpoint to poll the status of a background upload job"""
+    job = _get_upload_job(job_id)
+    if job is None:
+        return _json({'status': 'unknown', 'message': 'Upload job not found'}, 404)
+
+    return _json(job)
+
 def parse_uploaded_file(file_path, original_filename):
     """Parse uploaded file using F1 timetable extractor"""
     try:
@@ -811,8 +1080,8 @@ def parse_uploaded_file(file_path, original_filename):
         converted_data = convert_extracted_data_to_app_format(data)
 
         # Save the converted data
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(converted_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(json_dumps(converted_data, indent=True))
 
         total_events = sum(len(day['events']) for day in data['days'])
         days_count = len(data['days'])
@@ -836,429 +1105,148 @@ def parse_uploaded_file(file_path, original_filename):
             'error': f'Error parsing PDF: {str(e)}'
         }
 
+# Event fields copied into app sessions, with the defaults for any that are missing
+_EVENT_DEFAULTS = {'start_time': '', 'end_time': '', 'category': '', 'description': '', 'location': ''}
+_event_fields = itemgetter(*_EVENT_DEFAULTS)
+
+def _event_to_session(event):
+    """Map one extracted timetable event to an app session"""
+    # Extractor output always has every field; only hand-edited JSON needs
+    # the defaults merged in
+    try:
+        start_time, end_time, category, description, location = _event_fields(event)
+    except KeyError:
+        start_time, end_time, category, description, location = _event_fields({**_EVENT_DEFAULTS, **event})
+
+    return {
+        'start_time': start_time,
+        'end_time': end_time,
+        'category': category,
+        'activity': description,
+        'location': location
+    }
+
 def convert_extracted_data_to_app_format(extracted_data):
     """Convert the extracted data format to the format expected by the existing app"""
-    converted = {
+    return {
         'event_name': extracted_data.get('event_name', ''),
         'location': extracted_data.get('location', ''),
         'year': extracted_data.get('year', ''),
         'version': extracted_data.get('version', ''),
-        'days': {}
-    }
-
-    for day in extracted_data.get('days', []):
-        date = day.get('date')
-        if date:
-            converted['days'][date] = {
+        'days': {
+            day['date']: {
                 'day_name': day.get('day_name'),
-                'sessions': [],
+                'sessions': [_event_to_session(event) for event in day.get('events', ())],
                 'other_events': []
             }
-
-            # Convert events to sessions format
-            for event in day.get('events', []):
-                session = {
-                    'start_time': event.get('start_time', ''),
-                    'end_time': event.get('end_time', ''),
-                    'category': event.get('category', ''),
-                    'activity': event.get('description', ''),
-                    'location': event.get('location', '')
-                }
-
-                # Add to sessions list
-                converted['days'][date]['sessions'].append(session)
-
-    return converted
+            for day in extracted_data.get('days', ()) if day.get('date')
+        }
+    }
 
 @app.route('/api/data-files')
 def api_data_files():
     """API endpoint to list current data files"""
     data_dir = Path(__file__).parent / 'data'
-    files = []
 
-    if data_dir.exists():
-        for file_path in data_dir.glob('*.json'):
-            files.append(file_path.name)
+    try:
+        files = [name for name in os.listdir(data_dir) if name.endswith('.json')]
+    except OSError:
+        files = []
 
-    return jsonify({'files': files})
+    return _json({'files': files})
 
 # Configuration file path
 CONFIG_FILE = Path(__file__).parent / 'data' / 'schedule_config.json'
 
+# Default schedule configuration, used when no config file exists and on reset
+_DEFAULT_CONFIG = {
+    'meal_times': {
+        'Tuesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
+        'Wednesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
+        'Thursday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
+        'Friday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
+        'Saturday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'},
+        'Sunday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'}
+    },
+    'hotel_leave_times': {
+        'Tuesday': '08:30',
+        'Wednesday': '08:30',
+        'Thursday': '08:30',
+        'Friday': '09:00',
+        'Saturday': '10:00',
+        'Sunday': '11:00'
+    }
+}
+
+# Parsed schedule config keyed on the file's mtime, plus its JSON encoding once
+# GET /api/config has asked for it. Callers treat the returned dict as
+# read-only, so it is shared rather than copied.
+_config_cache: Dict[str, Any] = {'mtime': None, 'data': None, 'body': None}
+
 def load_config():
     """Load schedule configuration from file"""
-    if CONFIG_FILE.exists():
+    try:
+        mtime = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None:
+        if mtime == _config_cache['mtime']:
+            return _config_cache['data']
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                config = json_loads(f.read())
+            _config_cache.update(mtime=mtime, data=config, body=None)
+            return config
         except Exception as e:
             logger.error(f"Error loading config: {e}")
 
     # Default configuration
-    return {
-        'meal_times': {
-            'Tuesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Wednesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Thursday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Friday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Saturday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'},
-            'Sunday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'}
-        },
-        'hotel_leave_times': {
-            'Tuesday': '08:30',
-            'Wednesday': '08:30',
-            'Thursday': '08:30',
-            'Friday': '09:00',
-            'Saturday': '10:00',
-            'Sunday': '11:00'
-        }
-    }
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+def load_config_json() -> bytes:
+    """Schedule configuration serialized as JSON, reused while the file is unchanged"""
+    config = load_config()
+    if config is not _config_cache['data']:
+        # Defaults (no readable config file) are not cached
+        return json_dumps(config)
+    if _config_cache['body'] is None:
+        _config_cache['body'] = json_dumps(config)
+    return _config_cache['body']
 
 def save_config(config):
     """Save schedule configuration to file"""
     try:
         DATA_DIR.mkdir(exist_ok=True)
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(json_dumps(config, indent=True))
+        _config_cache['mtime'] = None
         return True
     except Exception as e:
         logger.error(f"Error saving config: {e}")
         return False
 
+# Race weekend days shown and accepted on the /config page
+_DAYS = ('Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Meal times shown for a day missing from the saved config
+_MEAL_FALLBACK = {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'}
+
 @app.route('/config')
 @require_github_auth
+@gzip_html
 def config_page():
     """Configuration page for meal and hotel leave times"""
-    config = load_config()
-
-    html = '''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Schedule Configuration</title>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                background: #0f1419;
-                color: #e6e6e6;
-                padding: 20px;
-                line-height: 1.6;
-            }
-
-            .container {
-                max-width: 900px;
-                margin: 0 auto;
-            }
-
-            header {
-                text-align: center;
-                margin-bottom: 30px;
-                padding-bottom: 20px;
-                border-bottom: 2px solid #e10600;
-            }
-
-            h1 {
-                font-size: 2rem;
-                color: #e10600;
-                margin-bottom: 10px;
-            }
-
-            .back-link {
-                display: inline-block;
-                color: #e10600;
-                text-decoration: none;
-                margin-bottom: 20px;
-                padding: 8px 16px;
-                border: 1px solid #e10600;
-                border-radius: 4px;
-                transition: all 0.2s ease;
-            }
-
-            .back-link:hover {
-                background: #e10600;
-                color: white;
-            }
-
-            .section {
-                background: #1a1f2e;
-                border: 1px solid #2a3040;
-                border-radius: 12px;
-                padding: 24px;
-                margin-bottom: 30px;
-            }
-
-            .section-title {
-                font-size: 1.5rem;
-                color: #e10600;
-                margin-bottom: 20px;
-                padding-bottom: 10px;
-                border-bottom: 1px solid #2a3040;
-            }
-
-            .day-config {
-                display: grid;
-                grid-template-columns: 120px 1fr;
-                gap: 15px;
-                align-items: center;
-                margin-bottom: 15px;
-                padding: 15px;
-                background: #252b3d;
-                border-radius: 8px;
-            }
-
-            .day-name {
-                font-weight: 600;
-                color: #e10600;
-                font-size: 1.1rem;
-            }
-
-            .time-inputs {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 12px;
-            }
-
-            .time-field {
-                display: flex;
-                flex-direction: column;
-                gap: 5px;
-            }
-
-            .time-field label {
-                font-size: 0.85rem;
-                color: #999;
-                font-weight: 500;
-            }
-
-            .time-field input {
-                background: #1a1f2e;
-                border: 1px solid #2a3040;
-                color: #e6e6e6;
-                padding: 8px 12px;
-                border-radius: 6px;
-                font-size: 1rem;
-                font-family: monospace;
-                transition: all 0.2s ease;
-            }
-
-            .time-field input:focus {
-                outline: none;
-                border-color: #e10600;
-                background: #1f2430;
-            }
-
-            .button-group {
-                display: flex;
-                gap: 15px;
-                justify-content: center;
-                margin-top: 30px;
-            }
-
-            button {
-                background: #e10600;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 8px;
-                font-size: 1rem;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.2s ease;
-            }
-
-            button:hover {
-                background: #ff0800;
-                transform: translateY(-2px);
-                box-shadow: 0 4px 12px rgba(225, 6, 0, 0.3);
-            }
+    return render_template('config.html', days=_DAYS, config=load_config(), meal_fallback=_MEAL_FALLBACK)
 
-            button.secondary {
-                background: #2a3040;
-                color: #e6e6e6;
-            }
-
-            button.secondary:hover {
-                background: #3a4050;
-            }
-
-            .flash {
-                padding: 15px;
-                margin-bottom: 20px;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: 500;
-            }
-
-            .flash.success {
-                background: #28a745;
-                color: white;
-            }
-
-            .flash.error {
-                background: #dc3545;
-                color: white;
-            }
-
-            @media (max-width: 768px) {
-                .day-config {
-                    grid-template-columns: 1fr;
-                    gap: 10px;
-                }
-
-                .time-inputs {
-                    grid-template-columns: 1fr;
-                }
+_VALID_DAYS = frozenset(_DAYS)
+_VALID_MEALS = frozenset(('breakfast', 'lunch', 'dinner'))
 
-                .button-group {
-                    flex-direction: column;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <a href="/" class="back-link">← Back to Dashboard</a>
-
-            <header>
-                <h1>⚙️ Schedule Configuration</h1>
-                <p>Configure meal times and hotel departure times for each day</p>
-            </header>
-
-            <div id="flash-message"></div>
-
-            <form id="configForm">
-                <!-- Meal Times Section -->
-                <div class="section">
-                    <h2 class="section-title">🍽️ Meal Times</h2>
-    '''
-
-    # Add meal time inputs for each day
-    days = ['Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    for day in days:
-        meals = config['meal_times'].get(day, {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'})
-        html += f'''
-                    <div class="day-config">
-                        <div class="day-name">{day}</div>
-                        <div class="time-inputs">
-                            <div class="time-field">
-                                <label>🍳 Breakfast</label>
-                                <input type="time" name="{day}_breakfast" value="{meals['breakfast']}" required>
-                            </div>
-                            <div class="time-field">
-                                <label>🍽️ Lunch</label>
-                                <input type="time" name="{day}_lunch" value="{meals['lunch']}" required>
-                            </div>
-                            <div class="time-field">
-                                <label>🍷 Dinner</label>
-                                <input type="time" name="{day}_dinner" value="{meals['dinner']}" required>
-                            </div>
-                        </div>
-                    </div>
-        '''
-
-    html += '''
-                </div>
-
-                <!-- Hotel Leave Times Section -->
-                <div class="section">
-                    <h2 class="section-title">🏨 Hotel Departure Times</h2>
-    '''
-
-    # Add hotel leave time inputs for each day
-    for day in days:
-        leave_time = config['hotel_leave_times'].get(day, '08:30')
-        html += f'''
-                    <div class="day-config">
-                        <div class="day-name">{day}</div>
-                        <div class="time-inputs">
-                            <div class="time-field">
-                                <label>🚗 Departure Time</label>
-                                <input type="time" name="{day}_leave" value="{leave_time}" required>
-                            </div>
-                        </div>
-                    </div>
-        '''
-
-    html += '''
-                </div>
-
-                <div class="button-group">
-                    <button type="submit">Save Configuration</button>
-                    <button type="button" class="secondary" onclick="resetToDefaults()">Reset to Defaults</button>
-                </div>
-            </form>
-        </div>
-
-        <script>
-            const form = document.getElementById('configForm');
-            const flashMessage = document.getElementById('flash-message');
-
-            form.addEventListener('submit', async (e) => {
-                e.preventDefault();
-
-                const formData = new FormData(form);
-                const config = {
-                    meal_times: {},
-                    hotel_leave_times: {}
-                };
-
-                const days = ['Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'];
-
-                days.forEach(day => {
-                    config.meal_times[day] = {
-                        breakfast: formData.get(`${day}_breakfast`),
-                        lunch: formData.get(`${day}_lunch`),
-                        dinner: formData.get(`${day}_dinner`)
-                    };
-                    config.hotel_leave_times[day] = formData.get(`${day}_leave`);
-                });
-
-                try {
-                    const response = await fetch('/api/config', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify(config)
-                    });
-
-                    const result = await response.json();
-
-                    if (result.success) {
-                        showFlash('Configuration saved successfully!', 'success');
-                    } else {
-                        showFlash('Error saving configuration: ' + result.error, 'error');
-                    }
-                } catch (error) {
-                    showFlash('Error saving configuration: ' + error.message, 'error');
-                }
-            });
-
-            function showFlash(message, type) {
-                flashMessage.innerHTML = `<div class="flash ${type}">${message}</div>`;
-                setTimeout(() => {
-                    flashMessage.innerHTML = '';
-                }, 3000);
-            }
-
-            function resetToDefaults() {
-                if (confirm('Reset all times to default values?')) {
-                    window.location.href = '/api/config/reset';
-                }
-            }
-        </script>
-    </body>
-    </html>
-    '''
-
-    return html
+def _valid_time(t):
+    """Check for a 24-hour HH:MM time string"""
+    return (isinstance(t, str) and len(t) == 5 and t[2] == ':'
+            and t.isascii() and t[:2].isdigit() and t[3:].isdigit()
+            and int(t[:2]) < 24 and int(t[3:]) < 60)
 
 def validate_config(config):
     """Validate configuration input to prevent injection attacks"""
@@ -1270,17 +1258,16 @@ def validate_config(config):
         if not isinstance(config['meal_times'], dict):
             return False, "meal_times must be a dictionary"
 
-        valid_days = ['Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         for day, meals in config['meal_times'].items():
-            if day not in valid_days:
+            if day not in _VALID_DAYS:
                 return False, f"Invalid day: {day}"
             if not isinstance(meals, dict):
                 return False, f"Meals for {day} must be a dictionary"
             for meal_type, time in meals.items():
-                if meal_type not in ['breakfast', 'lunch', 'dinner']:
+                if meal_type not in _VALID_MEALS:
                     return False, f"Invalid meal type: {meal_type}"
                 # Validate time format HH:MM
-                if not re.match(r'^\d{2}:\d{2}$', time):
+                if not _valid_time(time):
                     return False, f"Invalid time format for {meal_type}: {time}"
 
     # Validate hotel_leave_times
@@ -1288,11 +1275,10 @@ def validate_config(config):
         if not isinstance(config['hotel_leave_times'], dict):
             return False, "hotel_leave_times must be a dictionary"
 
-        valid_days = ['Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         for day, time in config['hotel_leave_times'].items():
-            if day not in valid_days:
+            if day not in _VALID_DAYS:
                 return False, f"Invalid day: {day}"
-            if not re.match(r'^\d{2}:\d{2}$', time):
+            if not _valid_time(time):
                 return False, f"Invalid time format for {day}: {time}"
 
     return True, "Valid"
@@ -1301,384 +1287,207 @@ def validate_config(config):
 def api_config():
     """API endpoint for getting and saving configuration"""
     if request.method == 'GET':
-        return jsonify(load_config())
+        return app.response_class(load_config_json(), mimetype='application/json')
 
     elif request.method == 'POST':
         # Require auth for POST
         if GITHUB_AUTH_ENABLED and not github.authorized:
-            return jsonify({'success': False, 'error': 'Authentication required'}), 401
+            return _json({'success': False, 'error': 'Authentication required'}, 401)
         try:
             config = request.get_json()
 
             # Validate input
             is_valid, error_msg = validate_config(config)
             if not is_valid:
-                return jsonify({'success': False, 'error': f'Invalid configuration: {error_msg}'}), 400
+                return _json({'success': False, 'error': f'Invalid configuration: {error_msg}'}, 400)
 
             if save_config(config):
-                return jsonify({'success': True})
+                return _json({'success': True})
             else:
-                return jsonify({'success': False, 'error': 'Failed to save configuration'})
+                return _json({'success': False, 'error': 'Failed to save configuration'})
         except Exception as e:
             logger.error(f"Config API error: {e}")
-            return jsonify({'success': False, 'error': 'Internal server error'}), 500
+            return _json({'success': False, 'error': 'Internal server error'}, 500)
 
 @app.route('/api/config/reset')
 @require_github_auth
 def reset_config():
     """Reset configuration to defaults"""
-    default_config = {
-        'meal_times': {
-            'Tuesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Wednesday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Thursday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Friday': {'breakfast': '07:00', 'lunch': '12:30', 'dinner': '19:00'},
-            'Saturday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'},
-            'Sunday': {'breakfast': '08:00', 'lunch': '13:00', 'dinner': '19:30'}
-        },
-        'hotel_leave_times': {
-            'Tuesday': '08:30',
-            'Wednesday': '08:30',
-            'Thursday': '08:30',
-            'Friday': '09:00',
-            'Saturday': '10:00',
-            'Sunday': '11:00'
-        }
-    }
-
-    if save_config(default_config):
+    if save_config(_DEFAULT_CONFIG):
         return redirect('/config')
     else:
         return "Error resetting configuration", 500
 
-@app.route('/git')
-@require_github_auth
-def git_page():
-    """Git repository management page"""
-    # Get git status
+_git_repo_handle = None
+
+def _git_repo():
+    """Open (once per process) the pygit2 repository containing DATA_DIR"""
+    global _git_repo_handle
+    if _git_repo_handle is None and pygit2 is not None:
+        try:
+            path = pygit2.discover_repository(str(DATA_DIR.parent))
+            if path:
+                _git_repo_handle = pygit2.Repository(path)
+        except Exception as e:
+            logger.error(f"Error opening git repository: {e}")
+    return _git_repo_handle
+
+# pygit2 status flags mapped to the index / worktree columns of `git status --short`
+_GIT_INDEX_FLAGS = ()
+_GIT_WT_FLAGS = ()
+if pygit2 is not None:
+    _GIT_INDEX_FLAGS = (
+        (pygit2.GIT_STATUS_INDEX_NEW, 'A'),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, 'M'),
+        (pygit2.GIT_STATUS_INDEX_DELETED, 'D'),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, 'R'),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, 'T'),
+    )
+    _GIT_WT_FLAGS = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, 'M'),
+        (pygit2.GIT_STATUS_WT_DELETED, 'D'),
+        (pygit2.GIT_STATUS_WT_RENAMED, 'R'),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, 'T'),
+    )
+
+def _git_status_code(flags):
+    """Two-letter `git status --short` code for a pygit2 status bitmask"""
+    if flags & pygit2.GIT_STATUS_CONFLICTED:
+        return 'UU'
+    if flags & pygit2.GIT_STATUS_WT_NEW and not flags & pygit2.GIT_STATUS_INDEX_NEW:
+        return '??'
+    x = next((c for bit, c in _GIT_INDEX_FLAGS if flags & bit), ' ')
+    y = next((c for bit, c in _GIT_WT_FLAGS if flags & bit), ' ')
+    return x + y
+
+def _git_page_info_pygit2(repo, refs=None):
+    """Status, branch, remote and last commit read in-process via pygit2"""
+    # Same ordering as the CLI: tracked changes first, untracked entries last
+    codes = sorted(
+        (code == '??', path, code)
+        for path, code in ((p, _git_status_code(f)) for p, f in repo.status(untracked_files='normal').items())
+    )
+    status = ''.join(f"{code} {path}\n" for _, path, code in codes)
+
+    head = repo.lookup_reference('HEAD')
+    target = head.target
+    branch = target[len('refs/heads/'):] if isinstance(target, str) and target.startswith('refs/heads/') else ''
+
+    if refs is not None:
+        return (status, branch, *refs)
+
+    try:
+        remote = repo.remotes['origin'].url
+    except (KeyError, ValueError):
+        remote = 'No remote configured'
+
+    if repo.head_is_unborn:
+        last_commit = 'No commits yet'
+    else:
+        commit = repo.head.peel(pygit2.Commit)
+        subject = commit.message.split('\n\n', 1)[0].replace('\n', ' ').strip()
+        last_commit = f"{commit.short_id} {subject}"
+
+    return status, branch, remote, last_commit
+
+def _porcelain_v2_to_short(line):
+    """Convert one `git status --porcelain=v2` entry to `git status --short` form"""
+    kind, _, rest = line.partition(' ')
+    if kind in ('?', '!'):
+        return f"{kind * 2} {rest}"
+    # Ordinary (1), renamed/copied (2) and unmerged (u) entries carry a
+    # different number of fields before the path
+    fields = rest.split(' ', {'1': 7, '2': 8, 'u': 9}[kind])
+    xy = fields[0].replace('.', ' ')
+    if kind == '2':
+        path, orig_path = fields[-1].split('\t', 1)
+        return f"{xy} {orig_path} -> {path}"
+    return f"{xy} {fields[-1]}"
+
+def _git_page_info_subprocess(refs=None):
+    """Status, branch, remote and last commit read from the git CLI"""
     import subprocess
 
+    # One call gives both the branch header and the working tree status
+    branch = 'unknown'
+    has_commits = True
     try:
-        status = subprocess.check_output(['git', 'status', '--short'], cwd=DATA_DIR.parent, stderr=subprocess.STDOUT).decode('utf-8')
+        output = subprocess.check_output(['git', 'status', '--porcelain=v2', '--branch'], cwd=DATA_DIR.parent, stderr=subprocess.STDOUT).decode('utf-8')
+        entries = []
+        for line in output.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                branch = '' if head == '(detached)' else head
+            elif line == '# branch.oid (initial)':
+                has_commits = False
+            elif line and not line.startswith('#'):
+                entries.append(_porcelain_v2_to_short(line))
+        # --short lists untracked (and ignored) entries after tracked changes
+        entries.sort(key=lambda entry: entry[0] in '?!')
+        status = ''.join(f"{entry}\n" for entry in entries)
     except subprocess.CalledProcessError as e:
         status = e.output.decode('utf-8')
 
-    try:
-        branch = subprocess.check_output(['git', 'branch', '--show-current'], cwd=DATA_DIR.parent).decode('utf-8').strip()
-    except:
-        branch = 'unknown'
+    if refs is not None:
+        return (status, branch, *refs)
 
     try:
         remote = subprocess.check_output(['git', 'remote', 'get-url', 'origin'], cwd=DATA_DIR.parent).decode('utf-8').strip()
     except:
         remote = 'No remote configured'
 
-    try:
-        last_commit = subprocess.check_output(['git', 'log', '-1', '--oneline'], cwd=DATA_DIR.parent).decode('utf-8').strip()
-    except:
-        last_commit = 'No commits yet'
+    last_commit = 'No commits yet'
+    if has_commits:
+        try:
+            last_commit = subprocess.check_output(['git', 'log', '-1', '--format=%h %s'], cwd=DATA_DIR.parent).decode('utf-8').strip()
+        except:
+            pass
+
+    return status, branch, remote, last_commit
+
+# Remote URL and last commit for the /git page, reused while the refs and repo
+# config are unchanged. The working tree status is always read fresh.
+_GIT_REFS_CACHE: Dict[str, Any] = {'key': None, 'value': None}
+
+def _git_refs_key():
+    """Cheap fingerprint of HEAD, the refs and the repo config"""
+    git_dir = DATA_DIR.parent / '.git'
+    key = []
+    # HEAD and its reflog move on checkout, commit, reset and pull; config
+    # changes with the remote
+    for name in ('HEAD', 'logs/HEAD', 'packed-refs', 'config'):
+        try:
+            key.append(os.stat(git_dir / name).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key) if key[0] is not None else None
+
+def _git_page_info():
+    """Collect the git details shown on the /git page"""
+    key = _git_refs_key()
+    refs = _GIT_REFS_CACHE['value'] if key is not None and _GIT_REFS_CACHE['key'] == key else None
+
+    info = None
+    repo = _git_repo()
+    if repo is not None:
+        try:
+            info = _git_page_info_pygit2(repo, refs)
+        except Exception as e:
+            logger.error(f"Error reading git repository via pygit2: {e}")
+    if info is None:
+        info = _git_page_info_subprocess(refs)
 
-    html = f'''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Git Management</title>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <style>
-            * {{
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }}
-
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                background: #0f1419;
-                color: #e6e6e6;
-                padding: 20px;
-                line-height: 1.6;
-            }}
-
-            .container {{
-                max-width: 1200px;
-                margin: 0 auto;
-            }}
-
-            header {{
-                text-align: center;
-                margin-bottom: 30px;
-                padding-bottom: 20px;
-                border-bottom: 2px solid #e10600;
-            }}
-
-            h1 {{
-                font-size: 2rem;
-                color: #e10600;
-                margin-bottom: 10px;
-            }}
-
-            .back-link {{
-                display: inline-block;
-                color: #e10600;
-                text-decoration: none;
-                margin-bottom: 20px;
-                padding: 8px 16px;
-                border: 1px solid #e10600;
-                border-radius: 4px;
-                transition: all 0.2s ease;
-            }}
-
-            .back-link:hover {{
-                background: #e10600;
-                color: white;
-            }}
-
-            .info-section {{
-                background: #1a1f2e;
-                border: 1px solid #2a3040;
-                border-radius: 12px;
-                padding: 24px;
-                margin-bottom: 20px;
-            }}
-
-            .info-row {{
-                display: grid;
-                grid-template-columns: 150px 1fr;
-                gap: 15px;
-                padding: 10px 0;
-                border-bottom: 1px solid #2a3040;
-            }}
-
-            .info-row:last-child {{
-                border-bottom: none;
-            }}
-
-            .info-label {{
-                font-weight: 600;
-                color: #e10600;
-            }}
-
-            .info-value {{
-                color: #e6e6e6;
-                font-family: monospace;
-            }}
-
-            .status-box {{
-                background: #1a1f2e;
-                border: 1px solid #2a3040;
-                border-radius: 8px;
-                padding: 15px;
-                margin-bottom: 20px;
-                font-family: monospace;
-                white-space: pre-wrap;
-                color: #e6e6e6;
-                max-height: 300px;
-                overflow-y: auto;
-            }}
-
-            .actions {{
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 15px;
-                margin-bottom: 20px;
-            }}
-
-            .action-btn {{
-                background: #e10600;
-                color: white;
-                border: none;
-                padding: 12px 20px;
-                border-radius: 8px;
-                font-size: 1rem;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.2s ease;
-            }}
-
-            .action-btn:hover {{
-                background: #ff0800;
-                transform: translateY(-2px);
-                box-shadow: 0 4px 12px rgba(225, 6, 0, 0.3);
-            }}
-
-            .action-btn.secondary {{
-                background: #2a3040;
-            }}
-
-            .action-btn.secondary:hover {{
-                background: #3a4050;
-            }}
-
-            .flash {{
-                padding: 15px;
-                margin-bottom: 20px;
-                border-radius: 8px;
-                text-align: center;
-            }}
-
-            .flash.success {{
-                background: #28a745;
-                color: white;
-            }}
-
-            .flash.error {{
-                background: #dc3545;
-                color: white;
-            }}
-
-            .commit-form {{
-                background: #1a1f2e;
-                border: 1px solid #2a3040;
-                border-radius: 12px;
-                padding: 24px;
-                margin-bottom: 20px;
-            }}
-
-            .form-group {{
-                margin-bottom: 15px;
-            }}
-
-            .form-group label {{
-                display: block;
-                color: #e10600;
-                font-weight: 600;
-                margin-bottom: 8px;
-            }}
-
-            .form-group input {{
-                width: 100%;
-                background: #0f1419;
-                border: 1px solid #2a3040;
-                color: #e6e6e6;
-                padding: 10px;
-                border-radius: 6px;
-                font-size: 1rem;
-            }}
-
-            .form-group input:focus {{
-                outline: none;
-                border-color: #e10600;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <a href="/" class="back-link">← Back to Dashboard</a>
-
-            <header>
-                <h1>🔧 Git Repository Management</h1>
-                <p>Manage version control for F1 Dashboard</p>
-            </header>
-
-            <div id="flash-message"></div>
-
-            <div class="info-section">
-                <h2 style="color: #e10600; margin-bottom: 15px;">Repository Info</h2>
-                <div class="info-row">
-                    <div class="info-label">Branch:</div>
-                    <div class="info-value">{branch}</div>
-                </div>
-                <div class="info-row">
-                    <div class="info-label">Remote:</div>
-                    <div class="info-value">{remote}</div>
-                </div>
-                <div class="info-row">
-                    <div class="info-label">Last Commit:</div>
-                    <div class="info-value">{last_commit}</div>
-                </div>
-            </div>
-
-            <h3 style="color: #e10600; margin-bottom: 10px;">Status</h3>
-            <div class="status-box">{status if status else 'Working tree clean'}</div>
-
-            <div class="commit-form">
-                <h3 style="color: #e10600; margin-bottom: 15px;">Commit Changes</h3>
-                <form id="commitForm" onsubmit="return commitChanges(event)">
-                    <div class="form-group">
-                        <label>Commit Message</label>
-                        <input type="text" id="commitMessage" placeholder="Update F1 schedule data" required>
-                    </div>
-                    <button type="submit" class="action-btn">Commit & Push</button>
-                </form>
-            </div>
-
-            <div class="actions">
-                <button class="action-btn secondary" onclick="gitPull()">Pull Latest</button>
-                <button class="action-btn secondary" onclick="gitStatus()">Refresh Status</button>
-                <button class="action-btn secondary" onclick="gitLog()">View Log</button>
-            </div>
-
-            <div id="output" class="status-box" style="display: none;"></div>
-        </div>
-
-        <script>
-            function showFlash(message, type) {{
-                const flash = document.getElementById('flash-message');
-                flash.innerHTML = `<div class="flash ${{type}}">${{message}}</div>`;
-                setTimeout(() => flash.innerHTML = '', 5000);
-            }}
-
-            async function commitChanges(e) {{
-                e.preventDefault();
-                const message = document.getElementById('commitMessage').value;
-
-                try {{
-                    const response = await fetch('/git/commit', {{
-                        method: 'POST',
-                        headers: {{'Content-Type': 'application/json'}},
-                        body: JSON.stringify({{ message: message }})
-                    }});
-                    const result = await response.json();
-
-                    if (result.success) {{
-                        showFlash('Changes committed and pushed successfully!', 'success');
-                        setTimeout(() => window.location.reload(), 1500);
-                    }} else {{
-                        showFlash('Error: ' + result.error, 'error');
-                    }}
-                }} catch (error) {{
-                    showFlash('Error: ' + error.message, 'error');
-                }}
-            }}
-
-            async function gitPull() {{
-                try {{
-                    const response = await fetch('/git/pull', {{ method: 'POST' }});
-                    const result = await response.json();
-
-                    if (result.success) {{
-                        showFlash('Pulled latest changes!', 'success');
-                        setTimeout(() => window.location.reload(), 1500);
-                    }} else {{
-                        showFlash('Error: ' + result.error, 'error');
-                    }}
-                }} catch (error) {{
-                    showFlash('Error: ' + error.message, 'error');
-                }}
-            }}
-
-            async function gitStatus() {{
-                window.location.reload();
-            }}
-
-            async function gitLog() {{
-                try {{
-                    const response = await fetch('/git/log');
-                    const result = await response.json();
-                    const output = document.getElementById('output');
-                    output.style.display = 'block';
-                    output.textContent = result.log || 'No commits';
-                }} catch (error) {{
-                    showFlash('Error: ' + error.message, 'error');
-                }}
-            }}
-        </script>
-    </body>
-    </html>
-    '''
-
-    return html
+    _GIT_REFS_CACHE.update(key=key, value=info[2:])
+    return info
 
+@app.route('/git')
+@require_github_auth
+@gzip_html
+def git_page():
+    """Git repository management page"""
+    status, branch, remote, last_commit = _git_page_info()
+
+    return render_template('git.html', status=status, branch=branch, remote=remote, last_commit=last_commit)
 @app.route('/git/commit', methods=['POST'])
 @require_github_auth
 def git_commit():
@@ -1691,28 +1500,26 @@ def git_commit():
 
         repo_dir = DATA_DIR.parent
 
-        # Add all changes
-        subprocess.run(['git', 'add', '.'], cwd=repo_dir, check=True)
-
-        # Commit
+        # Add, commit and push in a single shell; the message is passed as
+        # a positional argument, never interpolated into the script
         result = subprocess.run(
-            ['git', 'commit', '-m', message],
+            ['sh', '-c', 'git add . && git commit -m "$1" && git push', 'sh', message],
             cwd=repo_dir,
             capture_output=True,
             text=True
         )
 
-        if result.returncode != 0 and 'nothing to commit' in result.stdout:
-            return jsonify({{'success': False, 'error': 'Nothing to commit'}})
-
-        # Push
-        subprocess.run(['git', 'push'], cwd=repo_dir, check=True, capture_output=True)
+        if result.returncode != 0:
+            if 'nothing to commit' in result.stdout:
+                return _json({'success': False, 'error': 'Nothing to commit'})
+            error = result.stderr.strip() or result.stdout.strip() or f"git exited with status {result.returncode}"
+            return _json({'success': False, 'error': error})
 
-        return jsonify({{'success': True}})
-    except subprocess.CalledProcessError as e:
-        return jsonify({{'success': False, 'error': str(e)}})
+        return _json({'success': True})
     except Exception as e:
-        return jsonify({{'success': False, 'error': str(e)}})
+        return _json({'success': False, 'error': str(e)})
+    finally:
+        _GIT_REFS_CACHE['key'] = None
 
 @app.route('/git/pull', methods=['POST'])
 @require_github_auth
@@ -1728,9 +1535,11 @@ def git_pull():
             text=True,
             check=True
         )
-        return jsonify({{'success': True, 'output': result.stdout}})
+        return _json({'success': True, 'output': result.stdout})
     except subprocess.CalledProcessError as e:
-        return jsonify({{'success': False, 'error': e.stderr or str(e)}})
+        return _json({'success': False, 'error': e.stderr or str(e)})
+    finally:
+        _GIT_REFS_CACHE['key'] = None
 
 @app.route('/git/log')
 @require_github_auth
@@ -1745,9 +1554,9 @@ def git_log():
             capture_output=True,
             text=True
         )
-        return jsonify({{'log': result.stdout}})
+        return _json({'log': result.stdout})
     except Exception as e:
-        return jsonify({{'log': str(e)}})
+        return _json({'log': str(e)})
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
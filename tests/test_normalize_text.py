@@ -0,0 +1,45 @@
+"""Differential check of F1TimetableRawExtractor._normalize_text against the original implementation"""
+
+import random
+import re
+import unittest
+
+from app import F1TimetableRawExtractor, _NORM_MAP
+
+
+def reference_normalize(text):
+    """The original per-cell normalization: ordered replace chain, then cleanup regexes"""
+    if not text:
+        return text
+    normalized = text.upper()
+    for old, new in _NORM_MAP.items():
+        normalized = normalized.replace(old, new)
+    normalized = re.sub(r'\s*([,/\-&])\s*', r' \1 ', normalized)
+    normalized = re.sub(r'([A-Z])(\()', r'\1 \2', normalized)
+    normalized = normalized.replace('FORFIA', 'FOR FIA')
+    normalized = normalized.replace('F1ONLY', 'F1 ONLY')
+    normalized = re.sub(r"'([A-Z])", r"' \1", normalized)
+    normalized = re.sub(r'\s+', ' ', normalized)
+    return normalized.strip()
+
+
+class NormalizeTextTest(unittest.TestCase):
+    def check(self, text):
+        self.assertEqual(F1TimetableRawExtractor._normalize_text(text), reference_normalize(text), text)
+
+    def test_glued_phrases(self):
+        for text in ('F1CARCOVERSEALSREMOVED', 'F1EXPERIENCESCHAMPIONSCLUBTROPHYPHOTO',
+                     'LAPS,MAX30MINS', 'SAFETYCARCOVERSEALS', 'Formula1 PitLaneWalk',
+                     "DRIVERS' PARADE", 'TRACK  CLOSED\t(F1ONLY)', '', 'PRACTICE 1'):
+            self.check(text)
+
+    def test_random_key_concatenations(self):
+        rng = random.Random(0)
+        keys = list(_NORM_MAP)
+        fillers = ['', ' ', ',', '/', '-', '(', "'", 'A', '1', 'S']
+        for _ in range(20000):
+            self.check(''.join(rng.choice(keys) + rng.choice(fillers) for _ in range(rng.randint(1, 4))))
+
+
+if __name__ == '__main__':
+    unittest.main()